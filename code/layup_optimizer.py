@@ -1,6 +1,19 @@
 import numpy as np
-import copy
 import random
+from math import cos, exp, radians, sin
+from functools import lru_cache
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; the kernels below then run as plain Python.
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # ----------------------------
 # Material and Ply Definitions
@@ -25,6 +38,17 @@ t = 0.001       # 1 mm per ply, adjust as needed
 # Allowed ply orientations (degrees)
 allowed_angles = [0, 45, -45, 90]
 
+# Compact int8 angle codes used by the compiled kernels: code i <-> allowed_angles[i]
+# (0 -> 0, 1 -> 45, 2 -> -45, 3 -> 90).
+ANGLES = np.array(allowed_angles)
+ANGLE_CODE = {a: i for i, a in enumerate(allowed_angles)}
+n_angles = len(allowed_angles)
+# Row c lists the codes other than c, for drawing a different orientation in one lookup.
+OTHER_LUT = np.array([[b for b in range(n_angles) if b != c] for c in range(n_angles)], dtype=np.int8)
+
+# Weight per ply (kg, example value)
+ply_weight = 0.005
+
 # Minimum percentage (of full laminate) for each orientation type
 minPercent = 0.1  # at least 10% plies in each required orientation
 
@@ -35,15 +59,24 @@ max_full_plies = 40    # full laminate maximum (=> max_half = 20)
 min_half = min_full_plies // 2
 max_half = max_full_plies // 2
 
+# Number of SA iterations whose random draws are generated in one vectorized batch
+RNG_BLOCK = 4096
+
+# Temperature (as a fraction of initial_temp) an SA chain is reheated to when it restarts
+REHEAT_FRACTION = 0.5
+
 # ----------------------------
 # Classical Laminate Theory Functions
 # ----------------------------
 
-def compute_Qbar(angle_deg):
-    """Compute the transformed reduced stiffness matrix Qbar for a given ply orientation."""
-    theta = np.radians(angle_deg)
-    m = np.cos(theta)
-    n = np.sin(theta)
+def compute_Qbar_terms(angle_deg):
+    """
+    Compute the independent terms (Qbar11, Qbar12, Qbar22, Qbar16, Qbar26, Qbar66) of the
+    transformed reduced stiffness matrix for a given ply orientation, as plain floats.
+    """
+    theta = radians(angle_deg)
+    m = cos(theta)
+    n = sin(theta)
     m2 = m**2
     n2 = n**2
     m4 = m**4
@@ -58,10 +91,39 @@ def compute_Qbar(angle_deg):
     Qbar16 = (Q11 - Q12 - 2*Q66) * m3n - (Q22 - Q12 - 2*Q66) * mn3
     Qbar26 = (Q11 - Q12 - 2*Q66) * mn3 - (Q22 - Q12 - 2*Q66) * m3n
     Qbar66 = (Q11 + Q22 - 2*Q12 - 2*Q66) * m2n2 + Q66 * (m4 + n4)
+    return Qbar11, Qbar12, Qbar22, Qbar16, Qbar26, Qbar66
 
-    return np.array([[Qbar11, Qbar12, Qbar16],
+@lru_cache(maxsize=8)
+def compute_Qbar(angle_deg):
+    """
+    Compute the transformed reduced stiffness matrix Qbar for a given ply orientation.
+    Results are cached per angle, so the returned array is shared and read-only;
+    the optimizer itself only reads QBAR_LUT.
+    """
+    Qbar11, Qbar12, Qbar22, Qbar16, Qbar26, Qbar66 = compute_Qbar_terms(angle_deg)
+    Qbar = np.array([[Qbar11, Qbar12, Qbar16],
                      [Qbar12, Qbar22, Qbar26],
                      [Qbar16, Qbar26, Qbar66]])
+    Qbar.flags.writeable = False
+    return Qbar
+
+# Qbar for every allowed orientation, precomputed once at import.
+QBAR_TABLE = {a: compute_Qbar(a) for a in allowed_angles}
+# The same table as a contiguous (n_angles, 3, 3) array indexed by angle code.
+QBAR_LUT = np.stack([QBAR_TABLE[a] for a in allowed_angles])
+
+def bending_weight_table(max_plies):
+    """
+    Table of ply weights (z_{i+1}^3 - z_i^3)/3 with row N holding the N-ply laminate (zero-padded).
+    Ply i spans z = (2i - N)t/2 .. (2i + 2 - N)t/2, so its weight is
+    t^3 ((2i + 2 - N)^3 - (2i - N)^3) / 24; ply i and its mirror N-1-i share the same weight.
+    """
+    N, i = np.ogrid[:max_plies + 1, :max_plies]
+    weights = ((2*i + 2 - N)**3 - (2*i - N)**3) * (t**3) / 24.0
+    return np.where(i < N, weights, 0.0)
+
+# Ply weights for every laminate size the optimizer can produce, indexed [N, i].
+BENDING_WEIGHTS = bending_weight_table(max_full_plies)
 
 def compute_D_matrix(full_seq):
     """
@@ -70,14 +132,15 @@ def compute_D_matrix(full_seq):
     The total thickness is len(full_seq)*t.
     """
     N = len(full_seq)
-    total_thickness = N * t
-    # z-coordinates from bottom (-h/2) to top (h/2)
-    z = np.linspace(-total_thickness/2, total_thickness/2, N+1)
-    D = np.zeros((3,3))
-    for i in range(N):
-        Qbar = compute_Qbar(full_seq[i])
-        D += Qbar * (z[i+1]**3 - z[i]**3) / 3.0
-    return D
+    if N <= max_full_plies:
+        weights = BENDING_WEIGHTS[N, :N]
+    else:
+        # Same closed form as bending_weight_table(), for laminates beyond the table.
+        i = np.arange(N)
+        weights = ((2*i + 2 - N)**3 - (2*i - N)**3) * (t**3) / 24.0
+    # Per-ply weights (z_{i+1}^3 - z_i^3)/3, summed against the stacked (N,3,3) Qbars.
+    Qbars = QBAR_LUT[encode(full_seq)]
+    return np.einsum('i,ijk->jk', weights, Qbars)
 
 def laminate_deflection_metric(full_seq):
     """
@@ -93,44 +156,45 @@ def laminate_deflection_metric(full_seq):
 
 def laminate_weight(full_seq):
     """Compute laminate weight as number of plies times a per-ply weight."""
-    ply_weight = 0.005  # kg per ply (example value)
     return len(full_seq) * ply_weight
 
-def laminate_objective(full_seq):
+def laminate_objective(full_seq, check_symmetry=True):
     """
     Overall objective: combine a deflection metric and weight.
     Lower values are better. Penalty terms are added if constraints are violated.
+    check_symmetry can be disabled when full_seq is symmetric by construction.
     """
     # Trade-off: lower deflection metric and lower weight are desired.
-    return laminate_deflection_metric(full_seq) + laminate_weight(full_seq) + penalty(full_seq)
+    return (laminate_deflection_metric(full_seq) + laminate_weight(full_seq)
+            + penalty(full_seq, check_symmetry))
 
 # ----------------------------
 # Constraint Penalty Functions
 # ----------------------------
 
-def penalty(full_seq):
+def penalty(full_seq, check_symmetry=True):
     """
     Apply penalty terms if the laminate does not meet symmetry, balance, or minimum ply requirements.
-    For symmetry, the full laminate must be symmetric.
+    For symmetry, the full laminate must be symmetric (skipped if check_symmetry is False).
     For balance, the count of +45 must equal that of -45.
     Also, require a minimum percentage of plies for 0°, 90°, and (45 or -45).
     """
     pen = 0
     N = len(full_seq)
+    codes = encode(full_seq)
     # Symmetry: for a symmetric laminate, first half equals reversed second half.
     half = N // 2
-    if not np.allclose(full_seq[:half], full_seq[half:][::-1]):
+    if check_symmetry and not np.array_equal(codes[:half], codes[N - half:][::-1]):
         pen += 1e6
 
+    # Ply counts per angle code in a single pass.
+    count_0, count_p45, count_m45, count_90 = np.bincount(codes, minlength=n_angles)
+
     # Balance: number of 45° vs. -45° must be equal.
-    count_p45 = np.sum(np.array(full_seq) == 45)
-    count_m45 = np.sum(np.array(full_seq) == -45)
     pen += 1e6 * abs(count_p45 - count_m45)
 
     # Minimum ply percentages for each orientation type.
     required = int(N * minPercent)
-    count_0 = np.sum(np.array(full_seq) == 0)
-    count_90 = np.sum(np.array(full_seq) == 90)
     count_45_total = count_p45 + count_m45
 
     if count_0 < required:
@@ -147,13 +211,72 @@ def objective(half_seq):
     then compute the overall objective value.
     """
     full_seq = half_seq + half_seq[::-1]
-    return laminate_objective(full_seq)
+    # Mirroring the half makes full_seq symmetric, so the symmetry check can never fire.
+    return laminate_objective(full_seq, check_symmetry=False)
+
+def encode(seq):
+    """Convert a sequence of ply angles (degrees) to an int8 array of angle codes."""
+    return np.array([ANGLE_CODE[a] for a in seq], dtype=np.int8)
+
+def decode(codes):
+    """Convert an array of angle codes back to a list of ply angles (degrees)."""
+    return [int(a) for a in ANGLES[codes]]
+
+# ----------------------------
+# Compiled Objective (Numba)
+# ----------------------------
+
+@njit(cache=True)
+def d_matrix_nb(half):
+    """
+    Compiled compute_D_matrix() for the symmetric laminate built from int8 half-laminate codes.
+    Ply i and its mirror N-1-i have the same angle and weight, so only the half is summed, twice.
+    """
+    n_half = half.shape[0]
+    weights = BENDING_WEIGHTS[2 * n_half]
+    D = np.zeros((3, 3))
+    for i in range(n_half):
+        code = half[i]
+        w = 2 * weights[i]
+        for j in range(3):
+            for k in range(3):
+                D[j, k] += QBAR_LUT[code, j, k] * w
+    return D
+
+@njit(cache=True)
+def ply_counts_nb(half):
+    """Number of plies of each angle code in the full symmetric laminate."""
+    counts = np.zeros(n_angles, dtype=np.int64)
+    for i in range(half.shape[0]):
+        counts[half[i]] += 2
+    return counts
+
+@njit(cache=True)
+def objective_from_parts_nb(D11, counts, N):
+    """Objective of an N-ply laminate from its D11 term and per-code ply counts."""
+    if D11 <= 0:
+        deflection = 1e12  # Penalty for nonphysical stiffness
+    else:
+        deflection = 1.0 / D11
+
+    # Balance (+45 vs. -45) and minimum ply percentages, as in penalty().
+    pen = 1e6 * abs(counts[1] - counts[2])
+    required = int(N * minPercent)
+    if counts[0] < required:
+        pen += 1e6 * (required - counts[0])
+    if counts[3] < required:
+        pen += 1e6 * (required - counts[3])
+    if counts[1] + counts[2] < required:
+        pen += 1e6 * (required - counts[1] - counts[2])
+
+    return deflection + N * ply_weight + pen
 
 # ----------------------------
 # Simulated Annealing Optimizer (Variable-Length)
 # ----------------------------
 
-def simulated_annealing(n_iterations=10000, initial_temp=1.0, cooling_rate=0.999):
+def simulated_annealing(n_iterations=10000, initial_temp=1.0, cooling_rate=0.999, seed=None,
+                        restart_window=0):
     """
     Optimize both the ply sequence (orientations) and the total number of plies.
     The design variable is the half-laminate (which is then mirrored).
@@ -161,63 +284,384 @@ def simulated_annealing(n_iterations=10000, initial_temp=1.0, cooling_rate=0.999
       - Changing an orientation.
       - Inserting a ply (if below maximum half length).
       - Deleting a ply (if above minimum half length).
+    seed initializes the NumPy random generator (None for a fresh one).
+    If restart_window > 0 and the best objective has not improved for that many
+    iterations, the chain restarts from the best state and is reheated to
+    REHEAT_FRACTION * initial_temp. Off by default.
     """
+    rng = np.random.default_rng(seed)
     # Initialize with a random half-sequence of random length between min_half and max_half.
-    current_length = random.randint(min_half, max_half)
-    current_half = [random.choice(allowed_angles) for _ in range(current_length)]
-    current_obj = objective(current_half)
-    best_half = copy.deepcopy(current_half)
+    # Half-laminates live in fixed int8 buffers of angle codes (length max_half) and only
+    # the first current_len/candidate_len entries are meaningful; on acceptance the
+    # current and candidate buffers are swapped instead of copied.
+    current_len = int(rng.integers(min_half, max_half + 1))
+    current_buf = np.zeros(max_half, dtype=np.int8)
+    current_buf[:current_len] = rng.integers(0, n_angles, size=current_len)
+    candidate_buf = np.empty(max_half, dtype=np.int8)
+    # D matrix and ply counts of the current state, updated incrementally by 'change' moves.
+    current_D = d_matrix_nb(current_buf[:current_len])
+    current_counts = ply_counts_nb(current_buf[:current_len])
+    current_obj = objective_from_parts_nb(current_D[0, 0], current_counts, 2 * current_len)
+    best_buf = current_buf.copy()
+    best_len = current_len
     best_obj = current_obj
+    since_improvement = 0
     T = initial_temp
 
     for it in range(n_iterations):
+        b = it % RNG_BLOCK
+        if b == 0:
+            # Draw the uniforms for the next block of iterations in one go; acceptance
+            # compares against log(u) so no exp() is needed per iteration.
+            u_move, u_idx, u_angle = rng.random((3, RNG_BLOCK)).tolist()
+            log_u = np.log(rng.random(RNG_BLOCK)).tolist()
+
         # Determine allowed move types based on current half length.
         moves = ['change']
-        if len(current_half) < max_half:
+        if current_len < max_half:
             moves.append('insert')
-        if len(current_half) > min_half:
+        if current_len > min_half:
             moves.append('delete')
-        move = random.choice(moves)
-        
-        candidate_half = current_half.copy()
+        move = moves[int(u_move[b] * len(moves))]
         
         if move == 'change':
             # Change orientation of one random ply.
-            idx = random.randint(0, len(candidate_half) - 1)
+            candidate_len = current_len
+            candidate_buf[:current_len] = current_buf[:current_len]
+            idx = int(u_idx[b] * current_len)
             # Choose a new angle different from the current one.
-            candidate_half[idx] = random.choice([a for a in allowed_angles if a != candidate_half[idx]])
+            old = current_buf[idx]
+            new = OTHER_LUT[old, int(u_angle[b] * (n_angles - 1))]
+            candidate_buf[idx] = new
+            # Only ply idx and its mirror change, and both carry the same weight,
+            # so D and the counts can be updated without re-assembling the laminate.
+            w = 2 * BENDING_WEIGHTS[2 * current_len, idx]
+            candidate_D = current_D + (QBAR_LUT[new] - QBAR_LUT[old]) * w
+            candidate_counts = current_counts.copy()
+            candidate_counts[old] -= 2
+            candidate_counts[new] += 2
         
         elif move == 'insert':
             # Insert a new ply at a random position.
-            idx = random.randint(0, len(candidate_half))
-            candidate_half.insert(idx, random.choice(allowed_angles))
+            candidate_len = current_len + 1
+            idx = int(u_idx[b] * candidate_len)
+            candidate_buf[:idx] = current_buf[:idx]
+            candidate_buf[idx] = int(u_angle[b] * n_angles)
+            candidate_buf[idx + 1:candidate_len] = current_buf[idx:current_len]
         
         elif move == 'delete':
             # Delete a ply at a random position.
-            idx = random.randint(0, len(candidate_half) - 1)
-            candidate_half.pop(idx)
+            candidate_len = current_len - 1
+            idx = int(u_idx[b] * current_len)
+            candidate_buf[:idx] = current_buf[:idx]
+            candidate_buf[idx:candidate_len] = current_buf[idx + 1:current_len]
         
-        candidate_obj = objective(candidate_half)
+        candidate_half = candidate_buf[:candidate_len]
+        if move != 'change':
+            # Insert/delete change N and shift every z, so recompute from scratch.
+            candidate_D = d_matrix_nb(candidate_half)
+            candidate_counts = ply_counts_nb(candidate_half)
+        candidate_obj = objective_from_parts_nb(candidate_D[0, 0], candidate_counts, 2 * candidate_len)
         
-        # Accept candidate move if improved or probabilistically.
+        # Accept candidate move if improved or probabilistically (u < exp(-delta/T)).
+        since_improvement += 1
         delta = candidate_obj - current_obj
-        if delta < 0 or random.random() < np.exp(-delta / T):
-            current_half = candidate_half
+        if delta < 0 or log_u[b] < -delta / T:
+            current_buf, candidate_buf = candidate_buf, current_buf
+            current_len = candidate_len
+            current_D = candidate_D
+            current_counts = candidate_counts
             current_obj = candidate_obj
             if current_obj < best_obj:
-                best_half = copy.deepcopy(current_half)
+                np.copyto(best_buf, current_buf)
+                best_len = current_len
                 best_obj = current_obj
+                since_improvement = 0
 
         # Cool down
         T *= cooling_rate
 
+        # Once the chain has stopped improving, restart from the best state and reheat.
+        if restart_window and since_improvement >= restart_window:
+            np.copyto(current_buf, best_buf)
+            current_len = best_len
+            current_D = d_matrix_nb(current_buf[:current_len])
+            current_counts = ply_counts_nb(current_buf[:current_len])
+            current_obj = objective_from_parts_nb(current_D[0, 0], current_counts, 2 * current_len)
+            T = initial_temp * REHEAT_FRACTION
+            since_improvement = 0
+
         # Optional: print progress every 1000 iterations
         if (it + 1) % 1000 == 0:
-            print(f"Iteration {it+1}: Best Obj = {best_obj:.3e}, Half sequence length = {len(best_half)}")
+            print(f"Iteration {it+1}: Best Obj = {best_obj:.3e}, Half sequence length = {best_len}")
 
-    best_full_seq = best_half + best_half[::-1]
+    best_half = best_buf[:best_len]
+    best_full_seq = decode(np.concatenate((best_half, best_half[::-1])))
     return best_full_seq, best_obj
 
+# ----------------------------
+# Batched Simulated Annealing (Best-of-B Metropolis)
+# ----------------------------
+
+def batch_objective(halves, lengths):
+    """
+    Vectorized objective for a batch of half-laminates.
+    halves: (B, max_half) int8 angle codes, of which only the first lengths[b] entries of row b are used.
+    Returns the (B,) objective values, matching objective() for each laminate.
+    """
+    lengths = np.asarray(lengths)
+    N = 2 * lengths
+    used = np.arange(halves.shape[1]) < lengths[:, None]
+    # Each half ply stands for itself and its mirror, which share the same weight.
+    weights = 2 * BENDING_WEIGHTS[N, :halves.shape[1]] * used
+    Ds = np.einsum('bi,bijk->bjk', weights, QBAR_LUT[halves])
+    D11 = Ds[:, 0, 0]
+    deflection = np.where(D11 > 0, 1.0 / np.where(D11 > 0, D11, 1.0), 1e12)
+
+    # Per-code ply counts of the full laminates, then the same penalties as penalty().
+    counts = 2 * ((halves[:, :, None] == np.arange(n_angles)) & used[:, :, None]).sum(axis=1)
+    required = (N * minPercent).astype(int)
+    pen = 1e6 * np.abs(counts[:, 1] - counts[:, 2])
+    pen += 1e6 * np.maximum(required - counts[:, 0], 0)
+    pen += 1e6 * np.maximum(required - counts[:, 3], 0)
+    pen += 1e6 * np.maximum(required - counts[:, 1] - counts[:, 2], 0)
+
+    return deflection + N * ply_weight + pen
+
+def simulated_annealing_batched(n_iterations=10000, initial_temp=1.0, cooling_rate=0.999, seed=None,
+                                restart_window=0, batch_size=32):
+    """
+    Variant of simulated_annealing() that proposes batch_size moves from the current state
+    per iteration and evaluates them together with batch_objective().
+    Only the best of the batch is put to the Metropolis test, so this is a best-of-B
+    Metropolis scheme: greedier per iteration than simulated_annealing() at the same schedule.
+    Each iteration scores batch_size laminates, so it costs roughly batch_size times an
+    iteration of simulated_annealing(); scale n_iterations down accordingly.
+    """
+    rng = np.random.default_rng(seed)
+    positions = np.arange(max_half)
+    rows = np.arange(batch_size)
+
+    current_len = int(rng.integers(min_half, max_half + 1))
+    current_buf = np.zeros(max_half, dtype=np.int8)
+    current_buf[:current_len] = rng.integers(0, n_angles, size=current_len)
+    current_obj = batch_objective(current_buf[None, :], [current_len])[0]
+    best_buf = current_buf.copy()
+    best_len = current_len
+    best_obj = current_obj
+    since_improvement = 0
+    T = initial_temp
+
+    for it in range(n_iterations):
+        # Move per candidate, uniform over the moves allowed at the current length:
+        # 0 change, 1 insert, 2 delete.
+        moves = [0]
+        if current_len < max_half:
+            moves.append(1)
+        if current_len > min_half:
+            moves.append(2)
+        u_move, u_idx, u_angle = rng.random((3, batch_size))
+        move = np.array(moves)[(u_move * len(moves)).astype(int)]
+        insert = move == 1
+        delete = move == 2
+        lengths = current_len + insert - delete
+        idx = (u_idx * np.where(insert, current_len + 1, current_len)).astype(int)
+
+        # Candidate b reads ply src[b, j] of the current state (shifted past idx for
+        # insert/delete); the changed or inserted ply at idx is then overwritten.
+        src = np.broadcast_to(positions, (batch_size, max_half)).copy()
+        src -= insert[:, None] & (positions > idx[:, None])
+        src += delete[:, None] & (positions >= idx[:, None])
+        candidates = current_buf[np.minimum(src, max_half - 1)]
+        old = current_buf[np.minimum(idx, current_len - 1)]
+        new = np.where(insert, (u_angle * n_angles).astype(int),
+                       OTHER_LUT[old, (u_angle * (n_angles - 1)).astype(int)])
+        candidates[rows[~delete], idx[~delete]] = new[~delete]
+
+        objs = batch_objective(candidates, lengths)
+        b = int(np.argmin(objs))
+        since_improvement += 1
+        delta = objs[b] - current_obj
+        if delta < 0 or np.log(rng.random()) < -delta / T:
+            current_buf = candidates[b]
+            current_len = int(lengths[b])
+            current_obj = objs[b]
+            if current_obj < best_obj:
+                np.copyto(best_buf, current_buf)
+                best_len = current_len
+                best_obj = current_obj
+                since_improvement = 0
+
+        T *= cooling_rate
+
+        if restart_window and since_improvement >= restart_window:
+            current_buf = best_buf.copy()
+            current_len = best_len
+            current_obj = best_obj
+            T = initial_temp * REHEAT_FRACTION
+            since_improvement = 0
+
+        # Optional: print progress every 1000 iterations
+        if (it + 1) % 1000 == 0:
+            print(f"Iteration {it+1}: Best Obj = {best_obj:.3e}, Half sequence length = {best_len}")
+
+    best_half = best_buf[:best_len]
+    best_full_seq = decode(np.concatenate((best_half, best_half[::-1])))
+    return best_full_seq, float(best_obj)
+
+# ----------------------------
+# Parallel Multi-Chain Simulated Annealing (Numba)
+# ----------------------------
+
+@njit(cache=True)
+def d_terms_nb(half):
+    """Independent terms (D11, D12, D16, D22, D26, D66) of d_matrix_nb(half) as scalars."""
+    weights = BENDING_WEIGHTS[2 * half.shape[0]]
+    d11 = d12 = d16 = d22 = d26 = d66 = 0.0
+    for i in range(half.shape[0]):
+        Q = QBAR_LUT[half[i]]
+        w = 2 * weights[i]
+        d11 += Q[0, 0] * w
+        d12 += Q[0, 1] * w
+        d16 += Q[0, 2] * w
+        d22 += Q[1, 1] * w
+        d26 += Q[1, 2] * w
+        d66 += Q[2, 2] * w
+    return d11, d12, d16, d22, d26, d66
+
+@njit(cache=True, fastmath=True)
+def sa_chain_nb(n_iterations, initial_temp, cooling_rate, restart_window, seed, best_half):
+    """
+    One compiled simulated annealing chain with the same moves, schedule and
+    stagnation restarts as simulated_annealing(). The best half-laminate found is written into best_half
+    (length max_half); returns (best_obj, best_length).
+    D is carried as six scalars (it is symmetric) so the loop allocates nothing.
+    The chain seeds np.random with seed: under Numba that is Numba's own per-thread
+    generator, but without Numba it reseeds NumPy's global random state.
+    """
+    np.random.seed(seed)
+    half = np.empty(max_half, dtype=np.int8)
+    candidate = np.empty(max_half, dtype=np.int8)
+    n = np.random.randint(min_half, max_half + 1)
+    for i in range(n):
+        half[i] = np.random.randint(n_angles)
+    d11, d12, d16, d22, d26, d66 = d_terms_nb(half[:n])
+    counts = ply_counts_nb(half[:n])
+    candidate_counts = np.empty_like(counts)
+    current_obj = objective_from_parts_nb(d11, counts, 2 * n)
+    best_half[:n] = half[:n]
+    best_n = n
+    best_obj = current_obj
+    since_improvement = 0
+    T = initial_temp
+
+    for it in range(n_iterations):
+        # Pick uniformly among the moves allowed at this length: 0 change, 1 insert, 2 delete.
+        can_insert = n < max_half
+        can_delete = n > min_half
+        move = np.random.randint(1 + int(can_insert) + int(can_delete))
+        if move == 1 and not can_insert:
+            move = 2
+
+        candidate[:n] = half[:n]
+        candidate_counts[:] = counts
+        if move == 0:
+            m = n
+            idx = np.random.randint(n)
+            old = half[idx]
+            new = OTHER_LUT[old, np.random.randint(n_angles - 1)]
+            candidate[idx] = new
+            candidate_counts[old] -= 2
+            candidate_counts[new] += 2
+            w = 2 * BENDING_WEIGHTS[2 * n, idx]
+            Q_old = QBAR_LUT[old]
+            Q_new = QBAR_LUT[new]
+            c11 = d11 + (Q_new[0, 0] - Q_old[0, 0]) * w
+            c12 = d12 + (Q_new[0, 1] - Q_old[0, 1]) * w
+            c16 = d16 + (Q_new[0, 2] - Q_old[0, 2]) * w
+            c22 = d22 + (Q_new[1, 1] - Q_old[1, 1]) * w
+            c26 = d26 + (Q_new[1, 2] - Q_old[1, 2]) * w
+            c66 = d66 + (Q_new[2, 2] - Q_old[2, 2]) * w
+        else:
+            if move == 1:
+                m = n + 1
+                idx = np.random.randint(n + 1)
+                candidate[idx + 1:m] = half[idx:n]
+                candidate[idx] = np.random.randint(n_angles)
+                candidate_counts[candidate[idx]] += 2
+            else:
+                m = n - 1
+                idx = np.random.randint(n)
+                candidate[idx:m] = half[idx + 1:n]
+                candidate_counts[half[idx]] -= 2
+            c11, c12, c16, c22, c26, c66 = d_terms_nb(candidate[:m])
+        candidate_obj = objective_from_parts_nb(c11, candidate_counts, 2 * m)
+
+        since_improvement += 1
+        delta = candidate_obj - current_obj
+        # math.exp on the scalar: same code under Numba, no ufunc dispatch without it.
+        if delta < 0 or np.random.random() < exp(-delta / T):
+            half, candidate = candidate, half
+            counts, candidate_counts = candidate_counts, counts
+            n = m
+            d11, d12, d16, d22, d26, d66 = c11, c12, c16, c22, c26, c66
+            current_obj = candidate_obj
+            if current_obj < best_obj:
+                best_half[:n] = half[:n]
+                best_n = n
+                best_obj = current_obj
+                since_improvement = 0
+
+        T *= cooling_rate
+
+        if restart_window > 0 and since_improvement >= restart_window:
+            n = best_n
+            half[:n] = best_half[:n]
+            d11, d12, d16, d22, d26, d66 = d_terms_nb(half[:n])
+            counts[:] = ply_counts_nb(half[:n])
+            current_obj = objective_from_parts_nb(d11, counts, 2 * n)
+            T = initial_temp * REHEAT_FRACTION
+            since_improvement = 0
+
+    return best_obj, best_n
+
+@njit(parallel=True, cache=True, fastmath=True)
+def sa_multichain(n_chains, n_iterations, initial_temp, cooling_rate, restart_window, seed):
+    """
+    Run n_chains independent annealing chains in parallel (chain k seeded with seed + k)
+    and return the best half-laminate codes and objective across all chains.
+    """
+    best_halves = np.zeros((n_chains, max_half), dtype=np.int8)
+    best_lengths = np.zeros(n_chains, dtype=np.int64)
+    best_objs = np.zeros(n_chains)
+    for k in prange(n_chains):
+        best_objs[k], best_lengths[k] = sa_chain_nb(n_iterations, initial_temp, cooling_rate,
+                                                    restart_window, seed + k, best_halves[k])
+    k = np.argmin(best_objs)
+    return best_halves[k, :best_lengths[k]].copy(), best_objs[k]
+
+def simulated_annealing_multichain(n_chains=8, n_iterations=10000, initial_temp=1.0,
+                                   cooling_rate=0.999, seed=None, restart_window=0):
+    """
+    Multi-chain variant of simulated_annealing(): independent chains run in parallel
+    and the best laminate across them is returned as (full sequence in degrees, objective).
+    """
+    if seed is None:
+        seed = random.randrange(2**31 - n_chains)
+    if HAVE_NUMBA:
+        best_half, best_obj = sa_multichain(n_chains, n_iterations, initial_temp, cooling_rate,
+                                            restart_window, seed)
+    else:
+        # The plain-Python chains reseed np.random, so keep the caller's global state intact.
+        state = np.random.get_state()
+        try:
+            best_half, best_obj = sa_multichain(n_chains, n_iterations, initial_temp, cooling_rate,
+                                                restart_window, seed)
+        finally:
+            np.random.set_state(state)
+    best_full_seq = decode(np.concatenate((best_half, best_half[::-1])))
+    return best_full_seq, float(best_obj)
+
 # ----------------------------
 # Run the Optimization
 # ----------------------------
@@ -228,3 +672,10 @@ if __name__ == "__main__":
     print(best_seq)
     print("\nNumber of plies (full laminate):", len(best_seq))
     print("\nObjective Value (deflection metric + weight + penalties):", best_value)
+
+    best_seq, best_value = simulated_annealing_multichain(n_chains=8, n_iterations=10000,
+                                                          initial_temp=1.0, cooling_rate=0.999)
+    print("\nBest of 8 parallel chains (degrees):")
+    print(best_seq)
+    print("\nNumber of plies (full laminate):", len(best_seq))
+    print("\nObjective Value (deflection metric + weight + penalties):", best_value)